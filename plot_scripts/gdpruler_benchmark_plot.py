@@ -1,19 +1,43 @@
 import pandas as pd 
 import matplotlib as mpl
-import matplotlib.pyplot as plt
+from matplotlib import font_manager
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_pdf import PdfPages
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
 import seaborn as sns
 import numpy as np
 import os
+import tempfile
 import argparse
 from itertools import product
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+try:
+    import polars as pl
+except ImportError:  # polars is optional, pandas parses the CSV otherwise
+    pl = None
+
+try:
+    import pyarrow.feather  # pandas' multi-threaded CSV engine and the Feather results cache
+except ImportError:  # pyarrow is optional, pandas uses its C parser and nothing is cached otherwise
+    pyarrow = None
 
 # Set matplotlib backend and styling
 mpl.use("Agg")
-mpl.rcParams["text.latex.preamble"] = r"\usepackage{amsmath}"
 mpl.rcParams["pdf.fonttype"] = 42
 mpl.rcParams["ps.fonttype"] = 42
+mpl.rcParams["savefig.dpi"] = 300
 mpl.rcParams["font.family"] = "libertine"
 
+# Resolve the font once, and use the default family if Libertine is not installed
+# instead of failing the same lookup for every text element
+try:
+    font_manager.findfont(mpl.rcParams["font.family"][0], fallback_to_default=False)
+except ValueError:
+    mpl.rcParams["font.family"] = mpl.rcParamsDefault["font.family"]
+
 sns.set_style("whitegrid")
 sns.set_style("ticks", {"xtick.major.size": 8, "ytick.major.size": 8})
 sns.set_context("paper", rc={"font.size": 5, "axes.titlesize": 5, "axes.labelsize": 8})
@@ -39,82 +63,291 @@ ANNOTATION_FONTSIZE = FONTSIZE / 2
 # Patterns for bar plots
 hatches = ['', '///', '\\\\\\', 'xxx', '...', '+++', '|||', '---', 'ooo', '***']
 
-def load_gdpr_data(input_file):
+@lru_cache(maxsize=None)
+def palette(name, n_colors):
+    """Seaborn palette as a tuple of RGB tuples, built once per (name, size)"""
+    return tuple(sns.color_palette(name, n_colors))
+
+# Benchmark configuration columns and the metrics plotted against them
+FACTORS = ['use_encryption', 'compression_level', 'entry_size_bytes', 'consumers', 'batch_size']
+METRICS = ['entries_per_sec', 'write_amplification', 'avg_latency_ms', 'logical_throughput_gib_sec']
+
+# CSV columns used by the plots and the narrowest dtype that holds them
+CSV_DTYPES = {
+    'use_encryption': 'int8',
+    'compression_level': 'int8',
+    'consumers': 'int16',
+    'entry_size_bytes': 'int32',
+    'batch_size': 'int32',
+    'entries_per_sec': 'float32',
+    'write_amplification': 'float32',
+    'avg_latency_ms': 'float32',
+    'logical_throughput_gib_sec': 'float32',
+}
+# Low-cardinality configuration columns stored as categoricals, converted after
+# parsing since read_csv(dtype='category') would produce string categories
+CATEGORY_COLUMNS = {'consumers': 'category', 'entry_size_bytes': 'category', 'batch_size': 'category'}
+
+if pl is not None:
+    POLARS_DTYPES = {'int8': pl.Int8, 'int16': pl.Int16, 'int32': pl.Int32, 'float32': pl.Float32}
+
+def read_results_csv(input_file):
+    """Parse the benchmark CSV, using a multi-threaded reader (polars or pyarrow) when available"""
+    if pl is None:
+        engine = 'pyarrow' if pyarrow is not None else 'c'
+        df = pd.read_csv(input_file, usecols=list(CSV_DTYPES), dtype=CSV_DTYPES, engine=engine)
+    else:
+        # Give polars the schema up front, inferring it from the first rows breaks on metrics
+        # that look like integers until a value in exponent notation shows up further down
+        schema = {name: POLARS_DTYPES[dtype] for name, dtype in CSV_DTYPES.items()}
+        table = pl.read_csv(input_file, columns=list(CSV_DTYPES), schema_overrides=schema)
+        df = pd.DataFrame({name: table[name].to_numpy() for name in table.columns})
+    return df.astype(CATEGORY_COLUMNS)
+
+# Stored in the Feather cache metadata, a cache written with other column types is a miss
+CACHE_SCHEMA_KEY = b'gdpr_results_schema'
+CACHE_SCHEMA = repr((CSV_DTYPES, CATEGORY_COLUMNS)).encode()
+
+def read_cached_results(input_file, use_cache=True):
+    """Read the parsed results from a Feather copy next to the CSV while it is newer than the CSV"""
+    if pyarrow is None or not use_cache:  # Feather files are read and written through pyarrow
+        return read_results_csv(input_file)
+    
+    cache_file = input_file + '.feather'
+    if os.path.exists(cache_file) and os.path.getmtime(cache_file) >= os.path.getmtime(input_file):
+        try:
+            table = pyarrow.feather.read_table(cache_file)
+            if (table.schema.metadata or {}).get(CACHE_SCHEMA_KEY) == CACHE_SCHEMA:
+                return table.to_pandas().astype(CATEGORY_COLUMNS)
+            print(f"Ignoring cache {cache_file} written with other column types")
+        except (OSError, pyarrow.ArrowException) as e:  # e.g. a cache left truncated, parse the CSV again
+            print(f"Ignoring unreadable cache {cache_file}: {e}")
+    
+    df = read_results_csv(input_file)
+    # Write next to the cache and rename it into place, so an interrupted write never leaves a partial cache
+    temp_file = None
+    try:
+        fd, temp_file = tempfile.mkstemp(suffix='.feather.tmp', dir=os.path.dirname(cache_file) or '.')
+        os.close(fd)
+        table = pyarrow.Table.from_pandas(df, preserve_index=False)
+        table = table.replace_schema_metadata({**table.schema.metadata, CACHE_SCHEMA_KEY: CACHE_SCHEMA})
+        pyarrow.feather.write_feather(table, temp_file, compression='lz4')
+        os.replace(temp_file, cache_file)
+    except OSError as e:
+        print(f"Could not cache the results in {cache_file}: {e}")
+        if temp_file is not None and os.path.exists(temp_file):
+            os.remove(temp_file)
+    return df
+
+def categorical_labels(values, labels):
+    """Label values as a categorical, unknown values become missing"""
+    codes = pd.Index(list(labels)).get_indexer(values)
+    return pd.Categorical.from_codes(codes, categories=list(labels.values()))
+
+def load_gdpr_data(input_file, use_cache=True):
     """Load and preprocess GDPR benchmark data"""
-    df = pd.read_csv(input_file)
+    df = read_cached_results(input_file, use_cache)
+    
+    # Sorted values of each configuration column, computed once for all plots
+    df.attrs['levels'] = {col: np.unique(df[col].to_numpy()) for col in FACTORS}
     
-    # Create categorical labels for better plotting
-    df['encryption_label'] = df['use_encryption'].map({0: 'No Encryption', 1: 'With Encryption'})
-    df['compression_label'] = df['compression_level'].map({0: 'No Compression', 5: 'Medium (5)', 9: 'High (9)'})
-    df['entry_size_label'] = df['entry_size_bytes'].map({1024: '1KB', 2048: '2KB', 4096: '4KB'})
+    # Create categorical labels for better plotting, all added in a single assign
+    return df.assign(
+        encryption_label=categorical_labels(df['use_encryption'], {0: 'No Encryption', 1: 'With Encryption'}),
+        compression_label=categorical_labels(df['compression_level'], {0: 'No Compression', 5: 'Medium (5)', 9: 'High (9)'}),
+        entry_size_label=categorical_labels(df['entry_size_bytes'], {1024: '1KB', 2048: '2KB', 4096: '4KB'}),
+    )
 
-    return df
+def aggregate_gdpr_data(df):
+    """Aggregate benchmark results once over all configuration columns"""
+    # Keep sums and non-missing counts per metric so coarser means stay exact, and skip NaNs
+    # like .mean() does, when derived from the cube; 'count' is the number of result rows
+    grouped = df.groupby(FACTORS, observed=True)
+    cube = grouped[METRICS].sum().join(grouped[METRICS].count().add_suffix('_count'))
+    cube['count'] = grouped.size()
+    # The grouped index levels are exactly the sorted values present in the data
+    cube.attrs['levels'] = {name: level.to_numpy() for name, level in zip(cube.index.names, cube.index.levels)}
+    return cube
+
+def cube_mean(cube, by, metrics, **filters):
+    """Mean of metrics grouped by the given level(s), restricted to fixed factor values"""
+    for level, value in filters.items():
+        cube = cube[cube.index.get_level_values(level) == value]
+    columns = [metrics] if isinstance(metrics, str) else list(metrics)
+    counts = [f'{column}_count' for column in columns]
+    sums = cube.groupby(level=by, observed=True)[columns + counts].sum()
+    means = sums[columns] / sums[counts].to_numpy()
+    return means[metrics]
+
+def cube_table(cube, metric, fill=0, **keys):
+    """Mean of a metric over two levels as a rows x columns array, in the given key order, from one grouping"""
+    (rows, row_keys), (columns, column_keys) = keys.items()
+    # Only cells without results get the fill value, a NaN mean stays NaN
+    index = pd.MultiIndex.from_product([row_keys, column_keys], names=[rows, columns])
+    means = cube_mean(cube, [rows, columns], metric).reindex(index, fill_value=fill)
+    return means.to_numpy().reshape(len(row_keys), len(column_keys))
+
+def align(series, keys, fill=0):
+    """Values of series at the given keys as an array, missing keys get the fill value"""
+    return series.reindex(keys, fill_value=fill).to_numpy()
+
+def combination_table(by_combination, metric, combinations, keys, fill=0):
+    """Metric values at keys per (encryption, compression) combination, a NaN row for combinations without data"""
+    return np.array([align(by_combination.loc[combination, metric], keys, fill)
+                     if combination in by_combination.index else np.full(len(keys), np.nan)
+                     for combination in combinations])
+
+def plot_series(ax, x, rows, labels, colors, **kwargs):
+    """Plot each row against x in a single ax.plot call, skipping all-NaN rows, then label and color the lines"""
+    rows = np.asarray(rows, dtype=float)
+    keep = ~np.isnan(rows).all(axis=1)
+    if not keep.any():
+        return []
+    lines = ax.plot(x, rows[keep].T, **kwargs)
+    for line, label, color in zip(lines, np.asarray(labels)[keep], np.asarray(colors)[keep]):
+        line.set_label(label)
+        line.set_color(color)
+    return lines
+
+def grouped_bars(ax, x_positions, heights, width, offsets, labels, colors):
+    """Draw one bar series per row of heights, offset around x_positions, in a single ax.bar call"""
+    heights = np.asarray(heights, dtype=float)
+    n_series, n_groups = heights.shape
+    positions = (np.asarray(x_positions)[None, :] + np.asarray(offsets)[:, None]).ravel()
+    bars = ax.bar(positions, heights.ravel(), width, alpha=0.8, edgecolor='black',
+                  color=np.repeat(colors[:n_series], n_groups, axis=0))
+    
+    # Hatch each series and label its first bar so ax.legend() shows one entry per series
+    for i, label in enumerate(labels):
+        series = bars.patches[i * n_groups:(i + 1) * n_groups]
+        for patch in series:
+            patch.set_hatch(hatches[i])
+        series[0].set_label(label)
+    return bars
 
-def create_encryption_batch_analysis_plot(df, output_dir):
+def use_latex(enabled):
+    """Render text through LaTeX (with amsmath) only when requested"""
+    mpl.rcParams["text.usetex"] = enabled
+    if enabled:
+        mpl.rcParams["text.latex.preamble"] = r"\usepackage{amsmath}"
+
+def configure_rendering(latex, dpi):
+    """Apply the command line rendering options, in the main process and in every worker"""
+    use_latex(latex)
+    mpl.rcParams["savefig.dpi"] = dpi
+
+# File formats written for each figure, selectable with --formats
+OUTPUT_FORMATS = {'png': ('png',), 'pdf': ('pdf',), 'both': ('png', 'pdf')}
+
+def save_figure(fig, output_dir, name, formats, **kwargs):
+    """Save the figure once per requested format, at the savefig.dpi resolution, and return its savefig options"""
+    for fmt in formats:
+        fig.savefig(os.path.join(output_dir, f'{name}.{fmt}'), format=fmt, **kwargs)
+    return kwargs
+
+def plot_variant_lines(ax, segments, variants, linewidth=0.8, markersize=1.5):
+    """Draw one line per variant as a single LineCollection and return legend proxies"""
+    lines = LineCollection(segments, colors=[v['color'] for v in variants], linewidths=linewidth)
+    ax.add_collection(lines)
+    
+    # Variants sharing a marker shape get their markers from a single scatter
+    for marker in dict.fromkeys(v['marker'] for v in variants):
+        group = [(segment, v['color']) for segment, v in zip(segments, variants) if v['marker'] == marker]
+        points = np.concatenate([segment for segment, _ in group])
+        colors = [color for segment, color in group for _ in range(len(segment))]
+        ax.scatter(points[:, 0], points[:, 1], s=markersize ** 2, marker=marker, c=colors,
+                   linewidths=mpl.rcParams['lines.markeredgewidth'], zorder=lines.get_zorder())
+    ax.autoscale_view()
+    
+    return [Line2D([], [], marker=v['marker'], color=v['color'], linewidth=linewidth,
+                   markersize=markersize, label=v['label']) for v in variants]
+
+def render_plot(plot, data, output_dir, formats, return_figure=False):
+    """Run a plot function, sending its figure and savefig options back only when the caller needs them"""
+    result = plot(data, output_dir, formats)
+    return result if return_figure else None
+
+# Variants shown in the batch analysis plot
+# variants = [
+#     {'consumers': 4, 'entry_size_bytes': 256, 'label': '4 Writers, 256B Entry', 'color': '#9467bd', 'marker': 'v'},
+#     {'consumers': 8, 'entry_size_bytes': 256, 'label': '8 Writers, 256B Entry', 'color': '#8c564b', 'marker': 'p'},
+#     {'consumers': 4, 'entry_size_bytes': 1024, 'label': '4 Writers, 1KB Entry', 'color': '#1f77b4', 'marker': 'o'},
+#     {'consumers': 8, 'entry_size_bytes': 1024, 'label': '8 Writers, 1KB Entry', 'color': '#2ca02c', 'marker': '^'},
+#     {'consumers': 4, 'entry_size_bytes': 4096, 'label': '4 Writers, 4KB Entry', 'color': '#ff7f0e', 'marker': 's'},        
+#     {'consumers': 8, 'entry_size_bytes': 4096, 'label': '8 Writers, 4KB Entry', 'color': '#d62728', 'marker': 'D'}
+# ]
+BATCH_ANALYSIS_VARIANTS = (
+    {'consumers': 4, 'entry_size_bytes': 256, 'label': 'W:4,E:256', 'color': '#9467bd', 'marker': 'v'},
+    {'consumers': 8, 'entry_size_bytes': 256, 'label': 'W:8,E:256', 'color': '#8c564b', 'marker': 'p'},
+    {'consumers': 4, 'entry_size_bytes': 1024, 'label': 'W:4,E:1K', 'color': '#1f77b4', 'marker': 'o'},
+    {'consumers': 8, 'entry_size_bytes': 1024, 'label': 'W:8,E:1K', 'color': '#2ca02c', 'marker': '^'},
+    {'consumers': 4, 'entry_size_bytes': 4096, 'label': 'W:4,E:4K', 'color': '#ff7f0e', 'marker': 's'},        
+    {'consumers': 8, 'entry_size_bytes': 4096, 'label': 'W:8,E:4K', 'color': '#d62728', 'marker': 'D'},
+)
+
+# (encryption, compression) combinations compared in the writer threads plot
+KEY_COMBINATIONS = ((0, 0), (0, 9), (1, 0), (1, 9))
+KEY_COMBINATION_LABELS = ('No Enc, No Comp', 'No Enc, High Comp', 'Enc, No Comp', 'Enc, High Comp')
+
+# All (encryption, compression) combinations compared in the batch size plot
+ALL_COMBINATIONS = ((0, 0), (0, 5), (0, 9), (1, 0), (1, 5), (1, 9))
+ALL_COMBINATION_LABELS = ('No Enc, No Comp', 'No Enc, Med Comp', 'No Enc, High Comp',
+                          'Enc, No Comp', 'Enc, Med Comp', 'Enc, High Comp')
+
+# Fewer combinations for clarity in the batch size vs write amplification subplot
+SELECTED_COMBINATIONS = ((0, 0), (1, 0), (0, 9), (1, 9))
+SELECTED_LABELS = ('No Enc, No Comp', 'Enc, No Comp', 'No Enc, High Comp', 'Enc, High Comp')
+SELECTED_COLORS = ('blue', 'red', 'green', 'purple')
+
+def create_encryption_batch_analysis_plot(cube, output_dir, formats=OUTPUT_FORMATS['both']):
     """Create specific 2-subplot analysis: throughput and write amplification vs batch size"""
     
-    # Filter data: compression=0, encryption=1
-    filtered_df = df[(df['compression_level'] == 0) & (df['use_encryption'] == 1)]
+    # Filter the aggregate cube: compression=0, encryption=1
+    filtered = cube[(cube.index.get_level_values('compression_level') == 0) &
+                    (cube.index.get_level_values('use_encryption') == 1)]
     
-    if filtered_df.empty:
+    if filtered.empty:
         print("No data found for compression=0 and encryption=1")
         return
     
     # Create figure with 2 subplots side by side
-    fig, axes = plt.subplots(1, 2, figsize=(figwidth_half, 1.4))
-    
-    # Define the specific variants we want to show
-    # variants = [
-    #     {'consumers': 4, 'entry_size_bytes': 256, 'label': '4 Writers, 256B Entry', 'color': '#9467bd', 'marker': 'v'},
-    #     {'consumers': 8, 'entry_size_bytes': 256, 'label': '8 Writers, 256B Entry', 'color': '#8c564b', 'marker': 'p'},
-    #     {'consumers': 4, 'entry_size_bytes': 1024, 'label': '4 Writers, 1KB Entry', 'color': '#1f77b4', 'marker': 'o'},
-    #     {'consumers': 8, 'entry_size_bytes': 1024, 'label': '8 Writers, 1KB Entry', 'color': '#2ca02c', 'marker': '^'},
-    #     {'consumers': 4, 'entry_size_bytes': 4096, 'label': '4 Writers, 4KB Entry', 'color': '#ff7f0e', 'marker': 's'},        
-    #     {'consumers': 8, 'entry_size_bytes': 4096, 'label': '8 Writers, 4KB Entry', 'color': '#d62728', 'marker': 'D'}
-    # ]
-    variants = [
-        {'consumers': 4, 'entry_size_bytes': 256, 'label': 'W:4,E:256', 'color': '#9467bd', 'marker': 'v'},
-        {'consumers': 8, 'entry_size_bytes': 256, 'label': 'W:8,E:256', 'color': '#8c564b', 'marker': 'p'},
-        {'consumers': 4, 'entry_size_bytes': 1024, 'label': 'W:4,E:1K', 'color': '#1f77b4', 'marker': 'o'},
-        {'consumers': 8, 'entry_size_bytes': 1024, 'label': 'W:8,E:1K', 'color': '#2ca02c', 'marker': '^'},
-        {'consumers': 4, 'entry_size_bytes': 4096, 'label': 'W:4,E:4K', 'color': '#ff7f0e', 'marker': 's'},        
-        {'consumers': 8, 'entry_size_bytes': 4096, 'label': 'W:8,E:4K', 'color': '#d62728', 'marker': 'D'}
-    ]
+    fig = Figure(figsize=(figwidth_half, 1.4), layout='constrained')
+    axes = fig.subplots(1, 2)
+    fig.get_layout_engine().set(w_pad=0.05, h_pad=0.05)
+    
+    # Aggregate once per (variant, batch size) and reuse it for both subplots and the summary
+    agg = cube_mean(filtered, ['consumers', 'entry_size_bytes', 'batch_size'],
+                    ['entries_per_sec', 'write_amplification']).reset_index()
+    data_points = filtered['count'].groupby(level=['consumers', 'entry_size_bytes'], observed=True).sum()
+    by_variant = {(c, es): sub.set_index('batch_size')
+                  for (c, es), sub in agg.groupby(['consumers', 'entry_size_bytes'], observed=True)}
     
     # Get batch sizes from data and prepare x-axis mapping
-    batch_sizes = sorted(filtered_df['batch_size'].unique())
-    x_positions = list(range(1, len(batch_sizes) + 1))  # Linear positions: 1, 2, 3, ...
+    batch_sizes = np.unique(agg['batch_size'].to_numpy())
+    x_positions = np.arange(1, len(batch_sizes) + 1)  # Linear positions: 1, 2, 3, ...
     batch_labels = [str(bs) for bs in batch_sizes]  # Labels: "512", "2048", "8192", etc.
     
     # Left subplot: Throughput vs Batch Size
     ax_left = axes[0]
     
-    for variant in variants:
-        # Filter data for this specific variant
-        variant_df = filtered_df[
-            (filtered_df['consumers'] == variant['consumers']) & 
-            (filtered_df['entry_size_bytes'] == variant['entry_size_bytes'])
-        ]
+    segments, plotted = [], []
+    for variant in BATCH_ANALYSIS_VARIANTS:
+        # Look up the pre-aggregated data for this specific variant
+        variant_df = by_variant.get((variant['consumers'], variant['entry_size_bytes']))
         
-        if not variant_df.empty:
-            # Group by batch size and get mean throughput
-            throughput_data = variant_df.groupby('batch_size')['entries_per_sec'].mean()
+        if variant_df is not None:
+            # Mean throughput per batch size
+            throughput_data = variant_df['entries_per_sec']
             
-            # Prepare data for plotting
-            x_vals = []
-            y_vals = []
-            for i, bs in enumerate(batch_sizes):
-                if bs in throughput_data.index:
-                    x_vals.append(x_positions[i])  # Use linear position
-                    y_vals.append(throughput_data[bs] / 1000)  # Convert to K entries/sec
+            # Linear positions of the batch sizes this variant has, throughput in K entries/sec
+            x_vals = x_positions[batch_sizes.searchsorted(throughput_data.index.to_numpy())]
+            y_vals = throughput_data.to_numpy() / 1000
             
-            # Plot line with markers (thinner lines, smaller markers)
-            ax_left.plot(x_vals, y_vals, 
-                        marker=variant['marker'], 
-                        color=variant['color'],
-                        linewidth=0.8,  # Thinner lines
-                        markersize=1.5,   # Smaller markers
-                        label=variant['label'])
+            segments.append(np.column_stack([x_vals, y_vals]))
+            plotted.append(variant)
+    
+    # Plot all lines with markers at once (thinner lines, smaller markers)
+    legend_handles = plot_variant_lines(ax_left, segments, plotted)
     
     ax_left.set_xlabel('Batch Size', fontsize=LABEL_FONTSIZE, labelpad=1)
     ax_left.set_ylabel('Throughput (K entries/s)', fontsize=LABEL_FONTSIZE, labelpad=0)
@@ -129,34 +362,25 @@ def create_encryption_batch_analysis_plot(df, output_dir):
     # Right subplot: Write Amplification vs Batch Size
     ax_right = axes[1]
     
-    for variant in variants:
-        # Filter data for this specific variant
-        variant_df = filtered_df[
-            (filtered_df['consumers'] == variant['consumers']) & 
-            (filtered_df['entry_size_bytes'] == variant['entry_size_bytes'])
-        ]
+    segments, plotted = [], []
+    for variant in BATCH_ANALYSIS_VARIANTS:
+        # Look up the pre-aggregated data for this specific variant
+        variant_df = by_variant.get((variant['consumers'], variant['entry_size_bytes']))
         
-        if not variant_df.empty:
-            # Group by batch size and get mean write amplification
-            wa_data = variant_df.groupby('batch_size')['write_amplification'].mean()
+        if variant_df is not None:
+            # Mean write amplification per batch size
+            wa_data = variant_df['write_amplification']
             
-            # Prepare data for plotting
-            x_vals = []
-            y_vals = []
-            for i, bs in enumerate(batch_sizes):
-                if bs in wa_data.index:
-                    x_vals.append(x_positions[i])  # Use linear position
-                    # Convert write amplification to percentage
-                    y_vals.append((wa_data[bs] - 1) * 100)
-                    # y_vals.append(wa_data[bs])
+            # Linear positions of the batch sizes this variant has, write amplification as percentage
+            x_vals = x_positions[batch_sizes.searchsorted(wa_data.index.to_numpy())]
+            y_vals = (wa_data.to_numpy() - 1) * 100
+            # y_vals = wa_data.to_numpy()
             
-            # Plot line with markers (thinner lines, smaller markers)
-            ax_right.plot(x_vals, y_vals, 
-                         marker=variant['marker'], 
-                         color=variant['color'],
-                         linewidth=0.8,  # Thinner lines
-                         markersize=1.5,   # Smaller markers
-                         label=variant['label'])
+            segments.append(np.column_stack([x_vals, y_vals]))
+            plotted.append(variant)
+    
+    # Plot all lines with markers at once (thinner lines, smaller markers)
+    plot_variant_lines(ax_right, segments, plotted)
     
     ax_right.set_xlabel('Batch Size', fontsize=LABEL_FONTSIZE, labelpad=1)
     ax_right.set_ylabel('Write Amplification (%)', fontsize=LABEL_FONTSIZE, labelpad=0)
@@ -169,48 +393,39 @@ def create_encryption_batch_analysis_plot(df, output_dir):
     ax_right.grid(True, alpha=0.3, axis='y')
     
     # Add single legend to the figure (centered between subplots)
-    handles, labels = ax_left.get_legend_handles_labels()
-    fig.legend(handles, labels, loc='upper center', bbox_to_anchor=(0.5, 1.1), 
+    fig.legend(handles=legend_handles, loc='upper center', bbox_to_anchor=(0.5, 1.1), 
                ncol=6, fontsize=LEGEND_FONTSIZE,
                borderaxespad=0.4, columnspacing=0.3, labelspacing=0.25, borderpad=0.15, handletextpad=0.3, handlelength=0.8)
     
-    # Adjust layout to make room for legend
-    plt.tight_layout()
     
     # Save the plot
-    plt.savefig(os.path.join(output_dir, 'batch_analysis.png'), 
-                bbox_inches='tight', dpi=300, pad_inches=0)
-    plt.savefig(os.path.join(output_dir, 'batch_analysis.pdf'), 
-                bbox_inches='tight', dpi=300, pad_inches=0)
-    plt.close()
+    save_kwargs = save_figure(fig, output_dir, 'batch_analysis', formats, bbox_inches='tight', pad_inches=0)
     
     # Print data summary
-    print(f"Generated batch analysis paper plot with {len(variants)} variants:")
-    for variant in variants:
-        variant_df = filtered_df[
-            (filtered_df['consumers'] == variant['consumers']) & 
-            (filtered_df['entry_size_bytes'] == variant['entry_size_bytes'])
-        ]
-        data_points = len(variant_df)
-        print(f"  - {variant['label']}: {data_points} data points")
+    print(f"Generated batch analysis paper plot with {len(BATCH_ANALYSIS_VARIANTS)} variants:")
+    for variant in BATCH_ANALYSIS_VARIANTS:
+        points = int(data_points.get((variant['consumers'], variant['entry_size_bytes']), 0))
+        print(f"  - {variant['label']}: {points} data points")
+    
+    return fig, save_kwargs
         
-def create_encryption_effect_plots(df, output_dir):
+def create_encryption_effect_plots(cube, output_dir, formats=OUTPUT_FORMATS['both']):
     """Plot 1-2: Effect of Encryption on Performance across all configurations"""
-    fig, axes = plt.subplots(2, 2, figsize=(figwidth_full, 6))
+    fig = Figure(figsize=(figwidth_full, 6), layout='constrained')
+    axes = fig.subplots(2, 2)
     
     # Plot 1: Throughput by encryption across batch sizes
     ax = axes[0, 0]
-    batch_sizes = sorted(df['batch_size'].unique())
+    batch_sizes = cube.attrs['levels']['batch_size']
     x_positions = np.arange(len(batch_sizes))
     width = 0.35
     
-    no_enc = df[df['use_encryption'] == 0].groupby('batch_size')['entries_per_sec'].mean()
-    with_enc = df[df['use_encryption'] == 1].groupby('batch_size')['entries_per_sec'].mean()
+    grouped = cube_mean(cube, ['batch_size', 'use_encryption'], ['entries_per_sec', 'write_amplification']).unstack('use_encryption')
+    no_enc = grouped['entries_per_sec'][0]
+    with_enc = grouped['entries_per_sec'][1]
     
-    ax.bar(x_positions - width/2, no_enc.values / 1000, width, 
-           label='No Encryption', alpha=0.8, hatch=hatches[0], edgecolor='black')
-    ax.bar(x_positions + width/2, with_enc.values / 1000, width,
-           label='With Encryption', alpha=0.8, hatch=hatches[1], edgecolor='black')
+    grouped_bars(ax, x_positions, [no_enc.values / 1000, with_enc.values / 1000], width, [-width/2, width/2],
+                 ['No Encryption', 'With Encryption'], ['C0', 'C1'])
     
     ax.set_xlabel('Batch Size', fontsize=LABEL_FONTSIZE)
     ax.set_ylabel('Throughput (K entries/sec)', fontsize=LABEL_FONTSIZE)
@@ -221,16 +436,15 @@ def create_encryption_effect_plots(df, output_dir):
     
     # Plot 2: Throughput by encryption across entry sizes
     ax = axes[0, 1]
-    entry_sizes = sorted(df['entry_size_bytes'].unique())
+    entry_sizes = cube.attrs['levels']['entry_size_bytes']
     x_positions = np.arange(len(entry_sizes))
     
-    no_enc = df[df['use_encryption'] == 0].groupby('entry_size_bytes')['entries_per_sec'].mean()
-    with_enc = df[df['use_encryption'] == 1].groupby('entry_size_bytes')['entries_per_sec'].mean()
+    grouped = cube_mean(cube, ['entry_size_bytes', 'use_encryption'], ['entries_per_sec', 'write_amplification']).unstack('use_encryption')
+    no_enc = grouped['entries_per_sec'][0]
+    with_enc = grouped['entries_per_sec'][1]
     
-    ax.bar(x_positions - width/2, no_enc.values / 1000, width, 
-           label='No Encryption', alpha=0.8, hatch=hatches[0], edgecolor='black')
-    ax.bar(x_positions + width/2, with_enc.values / 1000, width,
-           label='With Encryption', alpha=0.8, hatch=hatches[1], edgecolor='black')
+    grouped_bars(ax, x_positions, [no_enc.values / 1000, with_enc.values / 1000], width, [-width/2, width/2],
+                 ['No Encryption', 'With Encryption'], ['C0', 'C1'])
     
     ax.set_xlabel('Entry Size', fontsize=LABEL_FONTSIZE)
     ax.set_ylabel('Throughput (K entries/sec)', fontsize=LABEL_FONTSIZE)
@@ -241,16 +455,15 @@ def create_encryption_effect_plots(df, output_dir):
     
     # Plot 3: Write amplification by encryption across compression levels
     ax = axes[1, 0]
-    comp_levels = sorted(df['compression_level'].unique())
+    comp_levels = cube.attrs['levels']['compression_level']
     x_positions = np.arange(len(comp_levels))
     
-    no_enc = df[df['use_encryption'] == 0].groupby('compression_level')['write_amplification'].mean()
-    with_enc = df[df['use_encryption'] == 1].groupby('compression_level')['write_amplification'].mean()
+    grouped = cube_mean(cube, ['compression_level', 'use_encryption'], ['entries_per_sec', 'write_amplification']).unstack('use_encryption')
+    no_enc = grouped['write_amplification'][0]
+    with_enc = grouped['write_amplification'][1]
     
-    ax.bar(x_positions - width/2, no_enc.values, width, 
-           label='No Encryption', alpha=0.8, hatch=hatches[0], edgecolor='black')
-    ax.bar(x_positions + width/2, with_enc.values, width,
-           label='With Encryption', alpha=0.8, hatch=hatches[1], edgecolor='black')
+    grouped_bars(ax, x_positions, [no_enc.values, with_enc.values], width, [-width/2, width/2],
+                 ['No Encryption', 'With Encryption'], ['C0', 'C1'])
     
     ax.set_xlabel('Compression Level', fontsize=LABEL_FONTSIZE)
     ax.set_ylabel('Write Amplification', fontsize=LABEL_FONTSIZE)
@@ -261,16 +474,15 @@ def create_encryption_effect_plots(df, output_dir):
     
     # Plot 4: Throughput by encryption across writer threads
     ax = axes[1, 1]
-    consumers_list = sorted(df['consumers'].unique())
+    consumers_list = cube.attrs['levels']['consumers']
     x_positions = np.arange(len(consumers_list))
     
-    no_enc = df[df['use_encryption'] == 0].groupby('consumers')['entries_per_sec'].mean()
-    with_enc = df[df['use_encryption'] == 1].groupby('consumers')['entries_per_sec'].mean()
+    grouped = cube_mean(cube, ['consumers', 'use_encryption'], ['entries_per_sec', 'write_amplification']).unstack('use_encryption')
+    no_enc = grouped['entries_per_sec'][0]
+    with_enc = grouped['entries_per_sec'][1]
     
-    ax.bar(x_positions - width/2, no_enc.values / 1000, width, 
-           label='No Encryption', alpha=0.8, hatch=hatches[0], edgecolor='black')
-    ax.bar(x_positions + width/2, with_enc.values / 1000, width,
-           label='With Encryption', alpha=0.8, hatch=hatches[1], edgecolor='black')
+    grouped_bars(ax, x_positions, [no_enc.values / 1000, with_enc.values / 1000], width, [-width/2, width/2],
+                 ['No Encryption', 'With Encryption'], ['C0', 'C1'])
     
     ax.set_xlabel('Writer Threads', fontsize=LABEL_FONTSIZE)
     ax.set_ylabel('Throughput (K entries/sec)', fontsize=LABEL_FONTSIZE)
@@ -279,31 +491,27 @@ def create_encryption_effect_plots(df, output_dir):
     ax.set_xticklabels([str(c) for c in consumers_list], fontsize=TICK_FONTSIZE)
     ax.legend(fontsize=LEGEND_FONTSIZE)
     
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, 'encryption_effect.png'), bbox_inches='tight', dpi=300)
-    plt.savefig(os.path.join(output_dir, 'encryption_effect.pdf'), bbox_inches='tight')
-    plt.close()
+    save_kwargs = save_figure(fig, output_dir, 'encryption_effect', formats, bbox_inches='tight')
+    return fig, save_kwargs
 
-def create_compression_effect_plots(df, output_dir):
+def create_compression_effect_plots(cube, output_dir, formats=OUTPUT_FORMATS['both']):
     """Plot 3-4: Effect of Compression on Performance across all configurations"""
-    fig, axes = plt.subplots(2, 2, figsize=(figwidth_full, 6))
+    fig = Figure(figsize=(figwidth_full, 6), layout='constrained')
+    axes = fig.subplots(2, 2)
     
-    compression_levels = sorted(df['compression_level'].unique())
-    colors = sns.color_palette("viridis", len(compression_levels))
+    compression_levels = cube.attrs['levels']['compression_level']
+    colors = palette('viridis', len(compression_levels))
     
     # Plot 1: Throughput by compression across batch sizes
     ax = axes[0, 0]
-    batch_sizes = sorted(df['batch_size'].unique())
+    batch_sizes = cube.attrs['levels']['batch_size']
     x_positions = np.arange(len(batch_sizes))
     width = 0.25
     
-    for i, comp_level in enumerate(compression_levels):
-        data = df[df['compression_level'] == comp_level].groupby('batch_size')['entries_per_sec'].mean()
-        throughput = [data[bs] / 1000 if bs in data.index else 0 for bs in batch_sizes]
-        
-        ax.bar(x_positions + i*width, throughput, width,
-               label=f'Compression {comp_level}', alpha=0.8, 
-               color=colors[i], hatch=hatches[i], edgecolor='black')
+    throughput = cube_table(cube, 'entries_per_sec', compression_level=compression_levels, batch_size=batch_sizes) / 1000
+    
+    grouped_bars(ax, x_positions, throughput, width, np.arange(len(compression_levels)) * width,
+                 [f'Compression {comp_level}' for comp_level in compression_levels], colors)
     
     ax.set_xlabel('Batch Size', fontsize=LABEL_FONTSIZE)
     ax.set_ylabel('Throughput (K entries/sec)', fontsize=LABEL_FONTSIZE)
@@ -314,16 +522,13 @@ def create_compression_effect_plots(df, output_dir):
     
     # Plot 2: Throughput by compression across entry sizes
     ax = axes[0, 1]
-    entry_sizes = sorted(df['entry_size_bytes'].unique())
+    entry_sizes = cube.attrs['levels']['entry_size_bytes']
     x_positions = np.arange(len(entry_sizes))
     
-    for i, comp_level in enumerate(compression_levels):
-        data = df[df['compression_level'] == comp_level].groupby('entry_size_bytes')['entries_per_sec'].mean()
-        throughput = [data[es] / 1000 if es in data.index else 0 for es in entry_sizes]
-        
-        ax.bar(x_positions + i*width, throughput, width,
-               label=f'Compression {comp_level}', alpha=0.8, 
-               color=colors[i], hatch=hatches[i], edgecolor='black')
+    throughput = cube_table(cube, 'entries_per_sec', compression_level=compression_levels, entry_size_bytes=entry_sizes) / 1000
+    
+    grouped_bars(ax, x_positions, throughput, width, np.arange(len(compression_levels)) * width,
+                 [f'Compression {comp_level}' for comp_level in compression_levels], colors)
     
     ax.set_xlabel('Entry Size', fontsize=LABEL_FONTSIZE)
     ax.set_ylabel('Throughput (K entries/sec)', fontsize=LABEL_FONTSIZE)
@@ -337,13 +542,10 @@ def create_compression_effect_plots(df, output_dir):
     encryption_settings = [0, 1]
     x_positions = np.arange(len(encryption_settings))
     
-    for i, comp_level in enumerate(compression_levels):
-        data = df[df['compression_level'] == comp_level].groupby('use_encryption')['write_amplification'].mean()
-        wa = [data[enc] if enc in data.index else 1.0 for enc in encryption_settings]
-        
-        ax.bar(x_positions + i*width, wa, width,
-               label=f'Compression {comp_level}', alpha=0.8, 
-               color=colors[i], hatch=hatches[i], edgecolor='black')
+    wa = cube_table(cube, 'write_amplification', fill=1.0, compression_level=compression_levels, use_encryption=encryption_settings)
+    
+    grouped_bars(ax, x_positions, wa, width, np.arange(len(compression_levels)) * width,
+                 [f'Compression {comp_level}' for comp_level in compression_levels], colors)
     
     ax.set_xlabel('Encryption Setting', fontsize=LABEL_FONTSIZE)
     ax.set_ylabel('Write Amplification', fontsize=LABEL_FONTSIZE)
@@ -354,16 +556,13 @@ def create_compression_effect_plots(df, output_dir):
     
     # Plot 4: Write amplification by compression across writer threads
     ax = axes[1, 1]
-    consumers_list = sorted(df['consumers'].unique())
+    consumers_list = cube.attrs['levels']['consumers']
     x_positions = np.arange(len(consumers_list))
     
-    for i, comp_level in enumerate(compression_levels):
-        data = df[df['compression_level'] == comp_level].groupby('consumers')['write_amplification'].mean()
-        wa = [data[c] if c in data.index else 1.0 for c in consumers_list]
-        
-        ax.bar(x_positions + i*width, wa, width,
-               label=f'Compression {comp_level}', alpha=0.8, 
-               color=colors[i], hatch=hatches[i], edgecolor='black')
+    wa = cube_table(cube, 'write_amplification', fill=1.0, compression_level=compression_levels, consumers=consumers_list)
+    
+    grouped_bars(ax, x_positions, wa, width, np.arange(len(compression_levels)) * width,
+                 [f'Compression {comp_level}' for comp_level in compression_levels], colors)
     
     ax.set_xlabel('Writer Threads', fontsize=LABEL_FONTSIZE)
     ax.set_ylabel('Write Amplification', fontsize=LABEL_FONTSIZE)
@@ -372,31 +571,27 @@ def create_compression_effect_plots(df, output_dir):
     ax.set_xticklabels([str(c) for c in consumers_list], fontsize=TICK_FONTSIZE)
     ax.legend(fontsize=LEGEND_FONTSIZE)
     
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, 'compression_effect.png'), bbox_inches='tight', dpi=300)
-    plt.savefig(os.path.join(output_dir, 'compression_effect.pdf'), bbox_inches='tight')
-    plt.close()
+    save_kwargs = save_figure(fig, output_dir, 'compression_effect', formats, bbox_inches='tight')
+    return fig, save_kwargs
 
-def create_entry_size_effect_plots(df, output_dir):
+def create_entry_size_effect_plots(cube, output_dir, formats=OUTPUT_FORMATS['both']):
     """Plot 5-6: Effect of Entry Size on Performance across all configurations"""
-    fig, axes = plt.subplots(2, 2, figsize=(figwidth_full, 6))
+    fig = Figure(figsize=(figwidth_full, 6), layout='constrained')
+    axes = fig.subplots(2, 2)
     
-    entry_sizes = sorted(df['entry_size_bytes'].unique())
-    colors = sns.color_palette("Set2", len(entry_sizes))
+    entry_sizes = cube.attrs['levels']['entry_size_bytes']
+    colors = palette('Set2', len(entry_sizes))
     
     # Plot 1: Entry throughput by entry size across batch sizes
     ax = axes[0, 0]
-    batch_sizes = sorted(df['batch_size'].unique())
+    batch_sizes = cube.attrs['levels']['batch_size']
     x_positions = np.arange(len(batch_sizes))
     width = 0.25
     
-    for i, entry_size in enumerate(entry_sizes):
-        data = df[df['entry_size_bytes'] == entry_size].groupby('batch_size')['entries_per_sec'].mean()
-        throughput = [data[bs] / 1000 if bs in data.index else 0 for bs in batch_sizes]
-        
-        ax.bar(x_positions + i*width, throughput, width,
-               label=f'{entry_size//1024}KB', alpha=0.8, 
-               color=colors[i], hatch=hatches[i], edgecolor='black')
+    throughput = cube_table(cube, 'entries_per_sec', entry_size_bytes=entry_sizes, batch_size=batch_sizes) / 1000
+    
+    grouped_bars(ax, x_positions, throughput, width, np.arange(len(entry_sizes)) * width,
+                 [f'{entry_size//1024}KB' for entry_size in entry_sizes], colors)
     
     ax.set_xlabel('Batch Size', fontsize=LABEL_FONTSIZE)
     ax.set_ylabel('Throughput (K entries/sec)', fontsize=LABEL_FONTSIZE)
@@ -407,16 +602,13 @@ def create_entry_size_effect_plots(df, output_dir):
     
     # Plot 2: Data throughput by entry size across compression
     ax = axes[0, 1]
-    comp_levels = sorted(df['compression_level'].unique())
+    comp_levels = cube.attrs['levels']['compression_level']
     x_positions = np.arange(len(comp_levels))
     
-    for i, entry_size in enumerate(entry_sizes):
-        data = df[df['entry_size_bytes'] == entry_size].groupby('compression_level')['logical_throughput_gib_sec'].mean()
-        throughput = [data[cl] if cl in data.index else 0 for cl in comp_levels]
-        
-        ax.bar(x_positions + i*width, throughput, width,
-               label=f'{entry_size//1024}KB', alpha=0.8, 
-               color=colors[i], hatch=hatches[i], edgecolor='black')
+    throughput = cube_table(cube, 'logical_throughput_gib_sec', entry_size_bytes=entry_sizes, compression_level=comp_levels)
+    
+    grouped_bars(ax, x_positions, throughput, width, np.arange(len(entry_sizes)) * width,
+                 [f'{entry_size//1024}KB' for entry_size in entry_sizes], colors)
     
     ax.set_xlabel('Compression Level', fontsize=LABEL_FONTSIZE)
     ax.set_ylabel('Data Throughput (GiB/sec)', fontsize=LABEL_FONTSIZE)
@@ -430,13 +622,10 @@ def create_entry_size_effect_plots(df, output_dir):
     encryption_settings = [0, 1]
     x_positions = np.arange(len(encryption_settings))
     
-    for i, entry_size in enumerate(entry_sizes):
-        data = df[df['entry_size_bytes'] == entry_size].groupby('use_encryption')['entries_per_sec'].mean()
-        throughput = [data[enc] / 1000 if enc in data.index else 0 for enc in encryption_settings]
-        
-        ax.bar(x_positions + i*width, throughput, width,
-               label=f'{entry_size//1024}KB', alpha=0.8, 
-               color=colors[i], hatch=hatches[i], edgecolor='black')
+    throughput = cube_table(cube, 'entries_per_sec', entry_size_bytes=entry_sizes, use_encryption=encryption_settings) / 1000
+    
+    grouped_bars(ax, x_positions, throughput, width, np.arange(len(entry_sizes)) * width,
+                 [f'{entry_size//1024}KB' for entry_size in entry_sizes], colors)
     
     ax.set_xlabel('Encryption', fontsize=LABEL_FONTSIZE)
     ax.set_ylabel('Throughput (K entries/sec)', fontsize=LABEL_FONTSIZE)
@@ -447,16 +636,13 @@ def create_entry_size_effect_plots(df, output_dir):
     
     # Plot 4: Throughput by entry size across writer threads
     ax = axes[1, 1]
-    consumers_list = sorted(df['consumers'].unique())
+    consumers_list = cube.attrs['levels']['consumers']
     x_positions = np.arange(len(consumers_list))
     
-    for i, entry_size in enumerate(entry_sizes):
-        data = df[df['entry_size_bytes'] == entry_size].groupby('consumers')['entries_per_sec'].mean()
-        throughput = [data[c] / 1000 if c in data.index else 0 for c in consumers_list]
-        
-        ax.bar(x_positions + i*width, throughput, width,
-               label=f'{entry_size//1024}KB', alpha=0.8, 
-               color=colors[i], hatch=hatches[i], edgecolor='black')
+    throughput = cube_table(cube, 'entries_per_sec', entry_size_bytes=entry_sizes, consumers=consumers_list) / 1000
+    
+    grouped_bars(ax, x_positions, throughput, width, np.arange(len(entry_sizes)) * width,
+                 [f'{entry_size//1024}KB' for entry_size in entry_sizes], colors)
     
     ax.set_xlabel('Writer Threads', fontsize=LABEL_FONTSIZE)
     ax.set_ylabel('Throughput (K entries/sec)', fontsize=LABEL_FONTSIZE)
@@ -465,29 +651,25 @@ def create_entry_size_effect_plots(df, output_dir):
     ax.set_xticklabels([str(c) for c in consumers_list], fontsize=TICK_FONTSIZE)
     ax.legend(fontsize=LEGEND_FONTSIZE, title='Entry Size')
     
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, 'entry_size_effect.png'), bbox_inches='tight', dpi=300)
-    plt.savefig(os.path.join(output_dir, 'entry_size_effect.pdf'), bbox_inches='tight')
-    plt.close()
+    save_kwargs = save_figure(fig, output_dir, 'entry_size_effect', formats, bbox_inches='tight')
+    return fig, save_kwargs
 
-def create_writer_threads_effect_plots(df, output_dir):
+def create_writer_threads_effect_plots(cube, output_dir, formats=OUTPUT_FORMATS['both']):
     """Plot 7-8: Effect of Writer Threads on Performance across all configurations"""
-    fig, axes = plt.subplots(2, 2, figsize=(figwidth_full, 6))
+    fig = Figure(figsize=(figwidth_full, 6), layout='constrained')
+    axes = fig.subplots(2, 2)
     
-    consumers_list = sorted(df['consumers'].unique())
-    colors = sns.color_palette("Set1", len(consumers_list))
+    consumers_list = cube.attrs['levels']['consumers']
+    colors = palette('Set1', len(consumers_list))
     
     # Plot 1: Throughput vs Writer Threads across batch sizes (line plot)
     ax = axes[0, 0]
-    batch_sizes = sorted(df['batch_size'].unique())
-    batch_colors = sns.color_palette("plasma", len(batch_sizes))
+    batch_sizes = cube.attrs['levels']['batch_size']
+    batch_colors = palette('plasma', len(batch_sizes))
     
-    for i, batch_size in enumerate(batch_sizes):
-        data = df[df['batch_size'] == batch_size].groupby('consumers')['entries_per_sec'].mean()
-        throughput = [data[c] / 1000 if c in data.index else 0 for c in consumers_list]
-        
-        ax.plot(consumers_list, throughput, marker='o', linewidth=2,
-               label=f'Batch {batch_size}', color=batch_colors[i])
+    throughput = cube_table(cube, 'entries_per_sec', batch_size=batch_sizes, consumers=consumers_list) / 1000
+    plot_series(ax, consumers_list, throughput, [f'Batch {batch_size}' for batch_size in batch_sizes],
+                batch_colors, marker='o', linewidth=2)
     
     ax.set_xlabel('Writer Threads', fontsize=LABEL_FONTSIZE)
     ax.set_ylabel('Throughput (K entries/sec)', fontsize=LABEL_FONTSIZE)
@@ -498,19 +680,13 @@ def create_writer_threads_effect_plots(df, output_dir):
     # Plot 2: Throughput vs Writer Threads across encryption/compression
     ax = axes[0, 1]
     
-    # Create combinations of encryption and compression
-    enc_comp_combinations = [(0, 0), (0, 9), (1, 0), (1, 9)]  # Key combinations
-    comb_colors = sns.color_palette("tab10", len(enc_comp_combinations))
-    comb_labels = ['No Enc, No Comp', 'No Enc, High Comp', 'Enc, No Comp', 'Enc, High Comp']
+    # One grouping over the (encryption, compression) key serves both combination subplots
+    by_combination = cube_mean(cube, ['use_encryption', 'compression_level', 'consumers'],
+                               ['entries_per_sec', 'avg_latency_ms'])
     
-    for i, (enc, comp) in enumerate(enc_comp_combinations):
-        subset = df[(df['use_encryption'] == enc) & (df['compression_level'] == comp)]
-        if not subset.empty:
-            data = subset.groupby('consumers')['entries_per_sec'].mean()
-            throughput = [data[c] / 1000 if c in data.index else 0 for c in consumers_list]
-            
-            ax.plot(consumers_list, throughput, marker='s', linewidth=2,
-                   label=comb_labels[i], color=comb_colors[i])
+    comb_colors = palette('tab10', len(KEY_COMBINATIONS))
+    throughput = combination_table(by_combination, 'entries_per_sec', KEY_COMBINATIONS, consumers_list) / 1000
+    plot_series(ax, consumers_list, throughput, KEY_COMBINATION_LABELS, comb_colors, marker='s', linewidth=2)
     
     ax.set_xlabel('Writer Threads', fontsize=LABEL_FONTSIZE)
     ax.set_ylabel('Throughput (K entries/sec)', fontsize=LABEL_FONTSIZE)
@@ -520,17 +696,15 @@ def create_writer_threads_effect_plots(df, output_dir):
     
     # Plot 3: Scaling efficiency across entry sizes
     ax = axes[1, 0]
-    entry_sizes = sorted(df['entry_size_bytes'].unique())
-    entry_colors = sns.color_palette("Set2", len(entry_sizes))
-    
-    for i, entry_size in enumerate(entry_sizes):
-        data = df[df['entry_size_bytes'] == entry_size].groupby('consumers')['entries_per_sec'].mean()
-        if consumers_list[0] in data.index and data[consumers_list[0]] > 0:
-            baseline = data[consumers_list[0]]
-            normalized = [data[c] / baseline if c in data.index else 0 for c in consumers_list]
-            
-            ax.plot(consumers_list, normalized, marker='^', linewidth=2,
-                   label=f'{entry_size//1024}KB', color=entry_colors[i])
+    entry_sizes = cube.attrs['levels']['entry_size_bytes']
+    entry_colors = palette('Set2', len(entry_sizes))
+    
+    throughput = cube_table(cube, 'entries_per_sec', entry_size_bytes=entry_sizes, consumers=consumers_list)
+    # Entry sizes without a single-writer baseline are left out
+    baseline = throughput[:, :1]
+    normalized = np.divide(throughput, baseline, out=np.full_like(throughput, np.nan), where=baseline > 0)
+    plot_series(ax, consumers_list, normalized, [f'{entry_size//1024}KB' for entry_size in entry_sizes],
+                entry_colors, marker='^', linewidth=2)
     
     # Add ideal scaling line
     ax.plot(consumers_list, [c/consumers_list[0] for c in consumers_list], 
@@ -545,14 +719,8 @@ def create_writer_threads_effect_plots(df, output_dir):
     # Plot 4: Latency vs Writer Threads across configurations
     ax = axes[1, 1]
     
-    for i, (enc, comp) in enumerate(enc_comp_combinations):
-        subset = df[(df['use_encryption'] == enc) & (df['compression_level'] == comp)]
-        if not subset.empty:
-            data = subset.groupby('consumers')['avg_latency_ms'].mean()
-            latency = [data[c] if c in data.index else 0 for c in consumers_list]
-            
-            ax.plot(consumers_list, latency, marker='D', linewidth=2,
-                   label=comb_labels[i], color=comb_colors[i])
+    latency = combination_table(by_combination, 'avg_latency_ms', KEY_COMBINATIONS, consumers_list)
+    plot_series(ax, consumers_list, latency, KEY_COMBINATION_LABELS, comb_colors, marker='D', linewidth=2)
     
     ax.set_xlabel('Writer Threads', fontsize=LABEL_FONTSIZE)
     ax.set_ylabel('Average Latency (ms)', fontsize=LABEL_FONTSIZE)
@@ -560,34 +728,26 @@ def create_writer_threads_effect_plots(df, output_dir):
     ax.legend(fontsize=LEGEND_FONTSIZE - 1)
     ax.grid(True, alpha=0.3)
     
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, 'writer_threads_effect.png'), bbox_inches='tight', dpi=300)
-    plt.savefig(os.path.join(output_dir, 'writer_threads_effect.pdf'), bbox_inches='tight')
-    plt.close()
+    save_kwargs = save_figure(fig, output_dir, 'writer_threads_effect', formats, bbox_inches='tight')
+    return fig, save_kwargs
 
-def create_batch_size_effect_plots(df, output_dir):
+def create_batch_size_effect_plots(cube, output_dir, formats=OUTPUT_FORMATS['both']):
     """Plot 9-10: Effect of Batch Size on Performance across all configurations"""
-    fig, axes = plt.subplots(2, 2, figsize=(figwidth_full, 6))
+    fig = Figure(figsize=(figwidth_full, 6), layout='constrained')
+    axes = fig.subplots(2, 2)
     
-    batch_sizes = sorted(df['batch_size'].unique())
+    batch_sizes = cube.attrs['levels']['batch_size']
     
     # Plot 1: Throughput vs Batch Size across encryption/compression (line plot)
     ax = axes[0, 0]
     
-    # Create combinations of encryption and compression
-    enc_comp_combinations = [(0, 0), (0, 5), (0, 9), (1, 0), (1, 5), (1, 9)]
-    comb_colors = sns.color_palette("tab10", len(enc_comp_combinations))
-    comb_labels = ['No Enc, No Comp', 'No Enc, Med Comp', 'No Enc, High Comp',
-                   'Enc, No Comp', 'Enc, Med Comp', 'Enc, High Comp']
-    
-    for i, (enc, comp) in enumerate(enc_comp_combinations):
-        subset = df[(df['use_encryption'] == enc) & (df['compression_level'] == comp)]
-        if not subset.empty:
-            data = subset.groupby('batch_size')['entries_per_sec'].mean()
-            throughput = [data[bs] / 1000 if bs in data.index else 0 for bs in batch_sizes]
-            
-            ax.plot(batch_sizes, throughput, marker='o', linewidth=2,
-                   label=comb_labels[i], color=comb_colors[i])
+    # One grouping over the (encryption, compression) key serves both combination subplots
+    by_combination = cube_mean(cube, ['use_encryption', 'compression_level', 'batch_size'],
+                               ['entries_per_sec', 'write_amplification'])
+    
+    comb_colors = palette('tab10', len(ALL_COMBINATIONS))
+    throughput = combination_table(by_combination, 'entries_per_sec', ALL_COMBINATIONS, batch_sizes) / 1000
+    plot_series(ax, batch_sizes, throughput, ALL_COMBINATION_LABELS, comb_colors, marker='o', linewidth=2)
     
     ax.set_xlabel('Batch Size', fontsize=LABEL_FONTSIZE)
     ax.set_ylabel('Throughput (K entries/sec)', fontsize=LABEL_FONTSIZE)
@@ -597,15 +757,12 @@ def create_batch_size_effect_plots(df, output_dir):
     
     # Plot 2: Throughput vs Batch Size across entry sizes
     ax = axes[0, 1]
-    entry_sizes = sorted(df['entry_size_bytes'].unique())
-    entry_colors = sns.color_palette("viridis", len(entry_sizes))
+    entry_sizes = cube.attrs['levels']['entry_size_bytes']
+    entry_colors = palette('viridis', len(entry_sizes))
     
-    for i, entry_size in enumerate(entry_sizes):
-        data = df[df['entry_size_bytes'] == entry_size].groupby('batch_size')['entries_per_sec'].mean()
-        throughput = [data[bs] / 1000 if bs in data.index else 0 for bs in batch_sizes]
-        
-        ax.plot(batch_sizes, throughput, marker='s', linewidth=2,
-               label=f'{entry_size//1024}KB', color=entry_colors[i])
+    throughput = cube_table(cube, 'entries_per_sec', entry_size_bytes=entry_sizes, batch_size=batch_sizes) / 1000
+    plot_series(ax, batch_sizes, throughput, [f'{entry_size//1024}KB' for entry_size in entry_sizes],
+                entry_colors, marker='s', linewidth=2)
     
     ax.set_xlabel('Batch Size', fontsize=LABEL_FONTSIZE)
     ax.set_ylabel('Throughput (K entries/sec)', fontsize=LABEL_FONTSIZE)
@@ -615,15 +772,12 @@ def create_batch_size_effect_plots(df, output_dir):
     
     # Plot 3: Latency vs Batch Size across writer threads
     ax = axes[1, 0]
-    consumers_list = sorted(df['consumers'].unique())
-    thread_colors = sns.color_palette("Set1", len(consumers_list))
+    consumers_list = cube.attrs['levels']['consumers']
+    thread_colors = palette('Set1', len(consumers_list))
     
-    for i, consumers in enumerate(consumers_list):
-        data = df[df['consumers'] == consumers].groupby('batch_size')['avg_latency_ms'].mean()
-        latency = [data[bs] if bs in data.index else 0 for bs in batch_sizes]
-        
-        ax.plot(batch_sizes, latency, marker='^', linewidth=2,
-               label=f'{consumers} Writers', color=thread_colors[i])
+    latency = cube_table(cube, 'avg_latency_ms', consumers=consumers_list, batch_size=batch_sizes)
+    plot_series(ax, batch_sizes, latency, [f'{consumers} Writers' for consumers in consumers_list],
+                thread_colors, marker='^', linewidth=2)
     
     ax.set_xlabel('Batch Size', fontsize=LABEL_FONTSIZE)
     ax.set_ylabel('Average Latency (ms)', fontsize=LABEL_FONTSIZE)
@@ -634,19 +788,8 @@ def create_batch_size_effect_plots(df, output_dir):
     # Plot 4: Write amplification vs Batch Size across all combinations
     ax = axes[1, 1]
     
-    # Show selected combinations for clarity
-    selected_combinations = [(0, 0), (1, 0), (0, 9), (1, 9)]
-    selected_labels = ['No Enc, No Comp', 'Enc, No Comp', 'No Enc, High Comp', 'Enc, High Comp']
-    selected_colors = ['blue', 'red', 'green', 'purple']
-    
-    for i, (enc, comp) in enumerate(selected_combinations):
-        subset = df[(df['use_encryption'] == enc) & (df['compression_level'] == comp)]
-        if not subset.empty:
-            data = subset.groupby('batch_size')['write_amplification'].mean()
-            wa = [data[bs] if bs in data.index else 1.0 for bs in batch_sizes]
-            
-            ax.plot(batch_sizes, wa, marker='D', linewidth=2,
-                   label=selected_labels[i], color=selected_colors[i])
+    wa = combination_table(by_combination, 'write_amplification', SELECTED_COMBINATIONS, batch_sizes, fill=1.0)
+    plot_series(ax, batch_sizes, wa, SELECTED_LABELS, SELECTED_COLORS, marker='D', linewidth=2)
     
     ax.set_xlabel('Batch Size', fontsize=LABEL_FONTSIZE)
     ax.set_ylabel('Write Amplification', fontsize=LABEL_FONTSIZE)
@@ -654,61 +797,86 @@ def create_batch_size_effect_plots(df, output_dir):
     ax.legend(fontsize=LEGEND_FONTSIZE)
     ax.grid(True, alpha=0.3)
     
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, 'batch_size_effect.png'), bbox_inches='tight', dpi=300)
-    plt.savefig(os.path.join(output_dir, 'batch_size_effect.pdf'), bbox_inches='tight')
-    plt.close()
+    save_kwargs = save_figure(fig, output_dir, 'batch_size_effect', formats, bbox_inches='tight')
+    return fig, save_kwargs
+
+# Heatmaps with more cells than this are drawn without per-cell annotations
+ANNOTATE_MAX_CELLS = 100
+
+def draw_heatmap(ax, pivot_data, fmt, cmap, cbar_label):
+    """Seaborn heatmap, annotated only when the pivot is small enough"""
+    sns.heatmap(pivot_data, annot=pivot_data.size <= ANNOTATE_MAX_CELLS, fmt=fmt, cmap=cmap,
+                ax=ax, cbar_kws={'label': cbar_label})
 
-def create_heatmaps(df, output_dir):
+def create_heatmaps(cube, output_dir, formats=OUTPUT_FORMATS['both']):
     """Plot 11-12: Performance heatmaps"""
-    fig, axes = plt.subplots(2, 2, figsize=(figwidth_full, 6))
+    fig = Figure(figsize=(figwidth_full, 6), layout='constrained')
+    axes = fig.subplots(2, 2)
     
     # Heatmap 1: Throughput by batch size vs compression (all entry sizes)
     ax = axes[0, 0]
-    pivot_data = df.groupby(['batch_size', 'compression_level'])['entries_per_sec'].mean().unstack()
+    pivot_data = cube_mean(cube, ['batch_size', 'compression_level'], 'entries_per_sec').unstack()
     pivot_data = pivot_data / 1000  # Convert to K entries/sec
     
-    sns.heatmap(pivot_data, annot=True, fmt='.0f', cmap='YlOrRd', 
-                ax=ax, cbar_kws={'label': 'K entries/sec'})
+    draw_heatmap(ax, pivot_data, '.0f', 'YlOrRd', 'K entries/sec')
     ax.set_title('(a) Throughput: Batch Size vs Compression', fontsize=TITLE_FONTSIZE, pad=5)
     ax.set_xlabel('Compression Level', fontsize=LABEL_FONTSIZE)
     ax.set_ylabel('Batch Size', fontsize=LABEL_FONTSIZE)
     
     # Heatmap 2: Write amplification by entry size vs encryption
     ax = axes[0, 1]
-    pivot_data = df.groupby(['entry_size_bytes', 'use_encryption'])['write_amplification'].mean().unstack()
+    pivot_data = cube_mean(cube, ['entry_size_bytes', 'use_encryption'], 'write_amplification').unstack()
     
-    sns.heatmap(pivot_data, annot=True, fmt='.3f', cmap='RdYlBu_r', 
-                ax=ax, cbar_kws={'label': 'Write Amplification'})
+    draw_heatmap(ax, pivot_data, '.3f', 'RdYlBu_r', 'Write Amplification')
     ax.set_title('(b) Write Amplification: Size vs Encryption', fontsize=TITLE_FONTSIZE, pad=5)
     ax.set_xlabel('Encryption (0=Off, 1=On)', fontsize=LABEL_FONTSIZE)
     ax.set_ylabel('Entry Size (bytes)', fontsize=LABEL_FONTSIZE)
     
     # Heatmap 3: Throughput by writer threads vs entry size
     ax = axes[1, 0]
-    pivot_data = df.groupby(['consumers', 'entry_size_bytes'])['entries_per_sec'].mean().unstack()
+    pivot_data = cube_mean(cube, ['consumers', 'entry_size_bytes'], 'entries_per_sec').unstack()
     pivot_data = pivot_data / 1000  # Convert to K entries/sec
     
-    sns.heatmap(pivot_data, annot=True, fmt='.0f', cmap='plasma', 
-                ax=ax, cbar_kws={'label': 'K entries/sec'})
+    draw_heatmap(ax, pivot_data, '.0f', 'plasma', 'K entries/sec')
     ax.set_title('(c) Throughput: Writers vs Entry Size', fontsize=TITLE_FONTSIZE, pad=5)
     ax.set_xlabel('Entry Size (bytes)', fontsize=LABEL_FONTSIZE)
     ax.set_ylabel('Writer Threads', fontsize=LABEL_FONTSIZE)
     
     # Heatmap 4: Latency by batch size vs writer threads
     ax = axes[1, 1]
-    pivot_data = df.groupby(['batch_size', 'consumers'])['avg_latency_ms'].mean().unstack()
+    pivot_data = cube_mean(cube, ['batch_size', 'consumers'], 'avg_latency_ms').unstack()
     
-    sns.heatmap(pivot_data, annot=True, fmt='.2f', cmap='viridis_r', 
-                ax=ax, cbar_kws={'label': 'Latency (ms)'})
+    draw_heatmap(ax, pivot_data, '.2f', 'viridis_r', 'Latency (ms)')
     ax.set_title('(d) Latency: Batch Size vs Writers', fontsize=TITLE_FONTSIZE, pad=5)
     ax.set_xlabel('Writer Threads', fontsize=LABEL_FONTSIZE)
     ax.set_ylabel('Batch Size', fontsize=LABEL_FONTSIZE)
     
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, 'heatmaps.png'), bbox_inches='tight', dpi=300)
-    plt.savefig(os.path.join(output_dir, 'heatmaps.pdf'), bbox_inches='tight')
-    plt.close()
+    save_kwargs = save_figure(fig, output_dir, 'heatmaps', formats, bbox_inches='tight')
+    return fig, save_kwargs
+
+# Output files and what each of them shows
+PLOT_DESCRIPTIONS = (
+    ("encryption_effect.png", 
+     "4-panel analysis of encryption impact across: (a) batch sizes, (b) entry sizes, (c) write amplification vs compression, (d) writer threads. Shows encryption overhead in different scenarios."),
+
+    ("compression_effect.png", 
+     "4-panel analysis of compression impact across: (a) batch sizes, (b) entry sizes, (c) write amplification vs encryption, (d) writer threads. Shows compression efficiency tradeoffs."),
+
+    ("entry_size_effect.png", 
+     "4-panel analysis of entry size impact across: (a) batch sizes, (b) data throughput vs compression, (c) encryption settings, (d) writer threads. Shows size vs performance relationships."),
+
+    ("writer_threads_effect.png", 
+     "4-panel analysis of writer threads scaling: (a) throughput vs batch sizes, (b) throughput vs encryption/compression combinations, (c) scaling efficiency by entry size, (d) latency impact."),
+
+    ("batch_size_effect.png", 
+     "4-panel analysis of batch size impact: (a) throughput vs encryption/compression combinations, (b) throughput vs entry sizes, (c) latency vs writer threads, (d) write amplification trends."),
+
+    ("heatmaps.png", 
+     "4 heatmaps showing: (a) throughput vs batch size/compression, (b) write amplification vs entry size/encryption, (c) throughput vs writers/entry size, (d) latency vs batch size/writers."),
+
+    ("batch_analysis.png", 
+     "2-panel analysis of batch size impact (with encryption=ON and compression=OFF): (a) throughput vs batch size, (b) write amplification vs batch size."),
+)
 
 def print_plot_summary():
     """Print summary of what each plot shows"""
@@ -716,30 +884,7 @@ def print_plot_summary():
     print("GDPR LOGGER BENCHMARK ANALYSIS - PLOT SUMMARY")
     print("="*70)
     
-    plots = [
-        ("encryption_effect.png", 
-         "4-panel analysis of encryption impact across: (a) batch sizes, (b) entry sizes, (c) write amplification vs compression, (d) writer threads. Shows encryption overhead in different scenarios."),
-        
-        ("compression_effect.png", 
-         "4-panel analysis of compression impact across: (a) batch sizes, (b) entry sizes, (c) write amplification vs encryption, (d) writer threads. Shows compression efficiency tradeoffs."),
-        
-        ("entry_size_effect.png", 
-         "4-panel analysis of entry size impact across: (a) batch sizes, (b) data throughput vs compression, (c) encryption settings, (d) writer threads. Shows size vs performance relationships."),
-        
-        ("writer_threads_effect.png", 
-         "4-panel analysis of writer threads scaling: (a) throughput vs batch sizes, (b) throughput vs encryption/compression combinations, (c) scaling efficiency by entry size, (d) latency impact."),
-        
-        ("batch_size_effect.png", 
-         "4-panel analysis of batch size impact: (a) throughput vs encryption/compression combinations, (b) throughput vs entry sizes, (c) latency vs writer threads, (d) write amplification trends."),
-        
-        ("heatmaps.png", 
-         "4 heatmaps showing: (a) throughput vs batch size/compression, (b) write amplification vs entry size/encryption, (c) throughput vs writers/entry size, (d) latency vs batch size/writers."),
-        
-        ("batch_analysis.png", 
-         "2-panel analysis of batch size impact (with encryption=ON and compression=OFF): (a) throughput vs batch size, (b) write amplification vs batch size.")
-    ]
-    
-    for i, (filename, description) in enumerate(plots, 1):
+    for i, (filename, description) in enumerate(PLOT_DESCRIPTIONS, 1):
         print(f"\n{i}. {filename}:")
         print(f"   {description}")
     
@@ -753,38 +898,92 @@ def print_plot_summary():
     print("- Detailed legends and consistent color schemes")
     print(f"{'='*70}")
 
+# Plots selectable with --plots, named after their output files
+PLOTS = {
+    'encryption_effect': create_encryption_effect_plots,
+    'compression_effect': create_compression_effect_plots,
+    'entry_size_effect': create_entry_size_effect_plots,
+    'writer_threads_effect': create_writer_threads_effect_plots,
+    'batch_size_effect': create_batch_size_effect_plots,
+    'heatmaps': create_heatmaps,
+    'batch_analysis': create_encryption_batch_analysis_plot,
+}
+
+def positive_int(value):
+    """argparse type for counts that must be at least 1"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
 def main():
     parser = argparse.ArgumentParser(description="Generate GDPR logger benchmark analysis plots")
     parser.add_argument("--input_file", type=str, default="gdpr_logger_benchmark_results.csv",
                        help="Input CSV file with benchmark results")
     parser.add_argument("--output_dir", type=str, default="gdpr_plots",
                        help="Directory to save the generated plots")
+    parser.add_argument("--plots", type=str, default="batch_analysis",
+                       help=f"Comma-separated plots to generate, or 'all' ({', '.join(PLOTS)})")
+    parser.add_argument("--formats", choices=list(OUTPUT_FORMATS), default="both",
+                       help="File formats to save each plot in")
+    parser.add_argument("--single_pdf", action="store_true",
+                       help="Write all PDF plots as pages of a single all_plots.pdf")
+    parser.add_argument("--no_cache", action="store_true",
+                       help="Always parse the CSV instead of reusing its cached <input_file>.feather copy")
+    parser.add_argument("--dpi", type=int, default=300,
+                       help="Resolution of the PNG plots (e.g. 150 for quicker drafts)")
+    parser.add_argument("--latex", action="store_true",
+                       help="Render text with LaTeX (slower, requires a TeX installation)")
+    parser.add_argument("--jobs", type=positive_int, default=None,
+                       help="Number of processes used to render plots (default: one per plot, up to the CPU count)")
     args = parser.parse_args()
+    selected = list(PLOTS) if args.plots == 'all' else args.plots.split(',')
+    unknown = [name for name in selected if name not in PLOTS]
+    if unknown:
+        parser.error(f"unknown plots: {', '.join(unknown)} (choose from {', '.join(PLOTS)})")
+    formats = OUTPUT_FORMATS[args.formats]
     
     # Create output directory
     os.makedirs(args.output_dir, exist_ok=True)
     
     # Load and preprocess data
     print(f"Loading data from {args.input_file}...")
-    df = load_gdpr_data(args.input_file)
+    df = load_gdpr_data(args.input_file, use_cache=not args.no_cache)
     print(f"Loaded {len(df)} benchmark results")
     
     print(f"Data summary:")
-    print(f"  - Batch sizes: {sorted(df['batch_size'].unique())}")
-    print(f"  - Entry sizes: {sorted(df['entry_size_bytes'].unique())}")
-    print(f"  - Writer threads: {sorted(df['consumers'].unique())}")
-    print(f"  - Encryption settings: {sorted(df['use_encryption'].unique())}")
-    print(f"  - Compression levels: {sorted(df['compression_level'].unique())}")
+    print(f"  - Batch sizes: {df.attrs['levels']['batch_size'].tolist()}")
+    print(f"  - Entry sizes: {df.attrs['levels']['entry_size_bytes'].tolist()}")
+    print(f"  - Writer threads: {df.attrs['levels']['consumers'].tolist()}")
+    print(f"  - Encryption settings: {df.attrs['levels']['use_encryption'].tolist()}")
+    print(f"  - Compression levels: {df.attrs['levels']['compression_level'].tolist()}")
+    
+    # Aggregate once, every plot reads the cube instead of filtering the raw results
+    cube = aggregate_gdpr_data(df)
     
-    # Generate all plots
+    # Generate the selected plots, each figure is independent so render them in separate processes
     print("Generating plots...")
-    # create_encryption_effect_plots(df, args.output_dir)
-    # create_compression_effect_plots(df, args.output_dir)
-    # create_entry_size_effect_plots(df, args.output_dir)
-    # create_writer_threads_effect_plots(df, args.output_dir)
-    # create_batch_size_effect_plots(df, args.output_dir)
-    # create_heatmaps(df, args.output_dir)
-    create_encryption_batch_analysis_plot(df, args.output_dir)
+    max_workers = min(args.jobs or os.cpu_count() or 1, len(selected))
+    configure_rendering(args.latex, args.dpi)
+    # With --single_pdf the workers skip their PDFs and main writes every figure into one file
+    single_pdf = args.single_pdf and 'pdf' in formats
+    plot_formats = tuple(fmt for fmt in formats if fmt != 'pdf') if single_pdf else formats
+    tasks = [(PLOTS[name], cube, args.output_dir, plot_formats, single_pdf) for name in selected]
+    if max_workers == 1:  # A single plot or --jobs 1 renders in this process, without a worker pool
+        results = [render_plot(*task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=configure_rendering,
+                                 initargs=(args.latex, args.dpi)) as executor:
+            futures = [executor.submit(render_plot, *task) for task in tasks]
+            results = [future.result() for future in futures]
+    
+    if single_pdf:
+        # Each page is saved with the options its plot uses for its own files
+        with PdfPages(os.path.join(args.output_dir, 'all_plots.pdf')) as pdf:
+            for result in results:
+                if result is not None:
+                    fig, save_kwargs = result
+                    pdf.savefig(fig, **save_kwargs)
     
     print(f"All plots saved to {args.output_dir}/")
     